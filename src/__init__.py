@@ -0,0 +1,13 @@
+__all__ = ["QC_and_smooth", "compute_risk_score"]
+
+
+def __getattr__(name):
+    # Resolved on first access so importing src.utilities doesn't pull in
+    # numba and compile the risk model
+    if name == "QC_and_smooth":
+        from src.quality_control import QC_and_smooth
+        return QC_and_smooth
+    if name == "compute_risk_score":
+        from src.risk_model import compute_risk_score
+        return compute_risk_score
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
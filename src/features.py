@@ -1,47 +1,59 @@
 from typing import Dict, Any
+import numpy as np
+from src.quality_control import CHANNELS
 from src.utilities.idf_curve_extraction import get_idf_depth
 from src.utilities.forecast_extraction import get_24h_precip
 
+# Wall names in CHANNELS order ("north_sensor" -> "north")
+WALLS = np.array([channel.removesuffix("_sensor") for channel in CHANNELS])
+
+
+def compute_features_batch(sat_arr: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Compute the saturation features for a stack of readings in one pass.
+
+    sat_arr has shape (N, 4) with columns ordered as WALLS. Every returned
+    value is an array of length N.
+    """
+
+    sat_arr = np.asarray(sat_arr, dtype=np.float64)
+
+    max_sat = sat_arr.max(axis=1)
+    min_sat = sat_arr.min(axis=1)
+
+    return {
+        "sat_avg": sat_arr.mean(axis=1),
+        "max_sat": max_sat,
+        "min_sat": min_sat,
+        "asymmetry": max_sat - min_sat,
+        # argmax returns the first wall on ties, same as the scalar lookup did
+        "wettest_side": WALLS[sat_arr.argmax(axis=1)],
+    }
+
 
 def compute_features(
-    saturation_values: Dict[str, float],
+    saturation_values: np.ndarray,
     lat: float,
     lon: float
 ) -> Dict[str, Any]:
     """
     Compute simple, interpretable features for the flood-risk model
     from normalized saturation values and rainfall information.
-    """
 
-    # 1. Extract saturation values by wall (assume keys exist)
-    sat_north_sensor = float(saturation_values["north_sensor"])
-    sat_south_sensor = float(saturation_values["south_sensor"])
-    sat_east_sensor = float(saturation_values["east_sensor"])
-    sat_west_sensor = float(saturation_values["west_sensor"])
-
-    sat_by_wall = {
-        "north": sat_north_sensor,
-        "south": sat_south_sensor,
-        "east":  sat_east_sensor,
-        "west":  sat_west_sensor,
-    }
+    saturation_values is a single (4,) reading ordered as CHANNELS.
+    """
 
-    # 2. Perimeter average
-    sat_values = list(sat_by_wall.values())
-    sat_avg = sum(sat_values) / len(sat_values)
+    # 1. View the reading as a one-row stack
+    sat_arr = np.asarray(saturation_values, dtype=np.float64).reshape(1, len(CHANNELS))
 
-    # 3. Asymmetry
-    max_sat = max(sat_values)
-    wettest_side = next(
-        wall for wall, value in sat_by_wall.items() if value == max_sat
-    )    
-    min_sat = min(sat_values)
-    asym_value = max_sat - min_sat
+    # 2. Perimeter average and 3. asymmetry
+    batch = compute_features_batch(sat_arr)
+    sat_avg = float(batch["sat_avg"][0])
 
     asymmetry_dict = {
-        "value": asym_value,
-        "max_sat": max_sat,
-        "wettest_side": wettest_side,
+        "value": float(batch["asymmetry"][0]),
+        "max_sat": float(batch["max_sat"][0]),
+        "wettest_side": str(batch["wettest_side"][0]),
     }
 
     # 4. Fetch the IDF value for the location
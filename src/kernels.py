@@ -0,0 +1,154 @@
+from typing import Tuple
+
+import numpy as np
+from numba import njit, prange
+
+from src.quality_control import CHANNELS
+from src.risk_model import compute_risk_score
+
+
+def process_batch(
+    sensors: np.ndarray,
+    prev: np.ndarray,
+    fcast: np.ndarray,
+    fc: float,
+    sat_vwc: float,
+    idf: float,
+) -> Tuple[np.ndarray, ...]:
+    """
+    Fused normalize -> features -> risk kernel for many readings at once.
+
+    Each row of `sensors` is one cleaned reading (north, south, east, west)
+    in fractional VWC. The row is normalized with the same formula as
+    normalize_moisture, reduced to the perimeter features, and scored with
+    compute_risk_score, all inside a single compiled loop.
+
+    Parameters
+    ----------
+    sensors : ndarray, shape (N, 4)
+        Cleaned soil moisture readings.
+    prev : ndarray, shape (N,)
+        Normalized perimeter-average saturation 1 hour before each reading.
+    fcast : ndarray, shape (N,)
+        24h forecast precipitation (mm) for each reading.
+    fc : float
+        Field capacity (VWC) for the soil preset, from
+        normalization.soil_properties.
+    sat_vwc : float
+        Saturation (VWC) for the soil preset, from
+        normalization.soil_properties.
+    idf : float
+        24h 2-year IDF depth (mm) for the location.
+
+    Returns
+    -------
+    sat : ndarray, shape (N, 4)
+        Normalized saturation per wall.
+    sat_avg, max_sat, sat_asymmetry : ndarray, shape (N,)
+        Perimeter average, wettest wall, and max - min saturation.
+    risk_score_internal, risk_score_displayed : ndarray, shape (N,)
+        Same meaning as the scalars returned by compute_risk_score.
+    base_soil_risk, storm_factor, site_sensitivity_factor : ndarray, shape (N,)
+        Per-reading risk components.
+
+    Raises
+    ------
+    ValueError
+        If `sensors` is not (N, len(CHANNELS)), `prev` or `fcast` is not
+        length N, any input is non-finite, `idf` is not positive, or
+        `sat_vwc` is not above `fc`.
+    """
+
+    sensors = np.asarray(sensors, dtype=np.float64)
+    prev = np.asarray(prev, dtype=np.float64)
+    fcast = np.asarray(fcast, dtype=np.float64)
+
+    # The compiled loop is not bounds-checked, so a wrong shape would read
+    # past the end of a row instead of failing
+    if sensors.ndim != 2 or sensors.shape[1] != len(CHANNELS):
+        raise ValueError(
+            f"process_batch: sensors must have shape (N, {len(CHANNELS)}), got {sensors.shape}"
+        )
+    n = sensors.shape[0]
+    if prev.shape != (n,) or fcast.shape != (n,):
+        raise ValueError(
+            f"process_batch: prev and fcast must have shape ({n},), "
+            f"got {prev.shape} and {fcast.shape}"
+        )
+    if not (np.isfinite(sensors).all() and np.isfinite(prev).all() and np.isfinite(fcast).all()):
+        raise ValueError("process_batch: sensors, prev and fcast must be finite")
+    if not (np.isfinite(idf) and idf > 0.0):
+        raise ValueError(f"process_batch: idf must be positive, got {idf}")
+    if not (np.isfinite(fc) and np.isfinite(sat_vwc) and sat_vwc > fc):
+        raise ValueError(f"process_batch: need fc < sat_vwc, got fc={fc}, sat_vwc={sat_vwc}")
+
+    return _process_batch(sensors, prev, fcast, float(fc), float(sat_vwc), float(idf))
+
+
+@njit(cache=True, fastmath={"contract"}, parallel=True)
+def _process_batch(
+    sensors: np.ndarray,
+    prev: np.ndarray,
+    fcast: np.ndarray,
+    fc: float,
+    sat_vwc: float,
+    idf: float,
+) -> Tuple[np.ndarray, ...]:
+    # Compiled loop behind process_batch; inputs are already validated
+    n = sensors.shape[0]
+    inv_range = 1.0 / (sat_vwc - fc)
+
+    sat = np.empty((n, 4))
+    sat_avg = np.empty(n)
+    max_sat = np.empty(n)
+    sat_asymmetry = np.empty(n)
+    risk_score_internal = np.empty(n)
+    risk_score_displayed = np.empty(n)
+    base_soil_risk = np.empty(n)
+    storm_factor = np.empty(n)
+    site_sensitivity_factor = np.empty(n)
+
+    for i in prange(n):
+        s = (sensors[i, 0] - fc) * inv_range
+        sat[i, 0] = s
+        total = s
+        mx = s
+        mn = s
+
+        for k in range(1, 4):
+            s = (sensors[i, k] - fc) * inv_range
+            sat[i, k] = s
+            total += s
+            mx = max(mx, s)
+            mn = min(mn, s)
+
+        avg = total / 4.0
+        sat_avg[i] = avg
+        max_sat[i] = mx
+        sat_asymmetry[i] = mx - mn
+
+        internal, displayed, base, storm, site = compute_risk_score(
+            avg, prev[i], fcast[i], idf
+        )
+        risk_score_internal[i] = internal
+        risk_score_displayed[i] = displayed
+        base_soil_risk[i] = base
+        storm_factor[i] = storm
+        site_sensitivity_factor[i] = site
+
+    return (
+        sat,
+        sat_avg,
+        max_sat,
+        sat_asymmetry,
+        risk_score_internal,
+        risk_score_displayed,
+        base_soil_risk,
+        storm_factor,
+        site_sensitivity_factor,
+    )
+
+
+# Compile (or load from the on-disk cache) at import so the first real
+# batch doesn't pay the JIT warmup
+_process_batch(np.zeros((1, 4)), np.zeros(1), np.zeros(1), 0.25, 0.40, 50.0)
@@ -1,26 +1,23 @@
-from src.quality_control import QC_and_smooth
+from src.quality_control import CHANNELS, QC_and_smooth
 from src.normalization import normalize_moisture
 from src.features import compute_features
-from src.risk_model import compute_risk_score, map_risk_category
+from src.risk_model import compute_risk_score, map_risk_category_batch
 
+import numpy as np
 import pandas as pd
 
 def run_pipeline():
     #TODO: fetch batch of data from Firebase: batch_readings, previous_valid_reading, soil_saturation_1h_ago, lat, lon, soil_type
-    data = pd.read_csv(f"data/test_data/current_soil_moisture.csv", parse_dates=["timestamp"]) # Placeholder for Firebase fetch
-    results = []
-    batch_readings = []
+    data = pd.read_csv(
+        f"data/test_data/current_soil_moisture.csv",
+        usecols=["timestamp", *CHANNELS],
+        dtype={channel: "float64" for channel in CHANNELS},
+        parse_dates=["timestamp"],
+        date_format="%Y-%m-%d %H:%M",
+    ) # Placeholder for Firebase fetch
 
-    for _, row in data.iterrows():
-        # 4 soil-moisture channels at this timestep
-        batch_readings.append(
-            {
-                "north_sensor": row["north_sensor"],
-                "south_sensor": row["south_sensor"],
-                "east_sensor": row["east_sensor"],
-                "west_sensor": row["west_sensor"],
-            }
-        )
+    # (n_readings, 4) soil-moisture array, columns ordered as CHANNELS
+    batch_readings = data[list(CHANNELS)].to_numpy(dtype=np.float64)
 
     previous_valid_reading = None  # TODO: replace this with a real batch fetch from Firebase
 
@@ -48,34 +45,41 @@ def run_pipeline():
                                     features["IDF_24h_2yr_mm"])
     
     #TODO: save risk_score_internal to Firebase (and other intermediate values if desired)
-    
-    category = map_risk_category(risk_score_displayed)
 
-    results.append(
+    categories = map_risk_category_batch([risk_score_displayed])
+
+    # float_format doesn't reach inside the asymmetry dict, so round its
+    # floats to the same 4 decimals here
+    asymmetry = {
+        key: round(value, 4) if isinstance(value, float) else value
+        for key, value in features["asymmetry"].items()
+    }
+
+    # Build the output frame column-wise: one entry per scored reading
+    results_df = pd.DataFrame(
         {
-            "raw_north": cleaned_readings["north_sensor"],
-            "raw_south": cleaned_readings["south_sensor"],
-            "raw_east": cleaned_readings["east_sensor"],
-            "raw_west": cleaned_readings["west_sensor"],
-            "sat_north": saturation["north_sensor"],
-            "sat_south": saturation["south_sensor"],
-            "sat_east": saturation["east_sensor"],
-            "sat_west": saturation["west_sensor"],
-            "sat_avg": features["sat_avg"],
-            "asymmetry": features["asymmetry"],
-            "forecast_24h_mm": features["forecast_24h_mm"],
-            "IDF_24h_2yr_mm": features["IDF_24h_2yr_mm"],
-            "base_soil_risk": base_soil_risk,
-            "storm_factor": storm_factor,
-            "site_sensitivity_factor": site_sensitivity_factor,
-            "risk_score_internal": risk_score_internal,
-            "risk_score": risk_score_displayed,
-            "category": category,
+            "raw_north": [cleaned_readings[0]],
+            "raw_south": [cleaned_readings[1]],
+            "raw_east": [cleaned_readings[2]],
+            "raw_west": [cleaned_readings[3]],
+            "sat_north": [saturation[0]],
+            "sat_south": [saturation[1]],
+            "sat_east": [saturation[2]],
+            "sat_west": [saturation[3]],
+            "sat_avg": [features["sat_avg"]],
+            "asymmetry": [asymmetry],
+            "forecast_24h_mm": [features["forecast_24h_mm"]],
+            "IDF_24h_2yr_mm": [features["IDF_24h_2yr_mm"]],
+            "base_soil_risk": [base_soil_risk],
+            "storm_factor": [storm_factor],
+            "site_sensitivity_factor": [site_sensitivity_factor],
+            "risk_score_internal": [risk_score_internal],
+            "risk_score": [risk_score_displayed],
+            "category": categories,
         }
     )
 
-    results_df = pd.DataFrame(results)
-    results_df.to_csv(f"data/results/risk_results.csv", index=False)
+    results_df.to_csv(f"data/results/risk_results.csv", index=False, float_format="%.4f")
     print(f"Wrote results to data/results/risk_results.csv")
 
 def main():
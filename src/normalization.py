@@ -1,9 +1,61 @@
-from turtle import pd
-from typing import Dict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Tuple
 
+import numpy as np
 import pandas as pd
 
-def normalize_moisture(cleaned_readings: Dict[str, float], soil_type: str) -> Dict[str, float]:
+SOIL_PROPERTIES_CSV = Path(__file__).resolve().parent.parent / "data" / "soil_water_properties.csv"
+
+
+@lru_cache(maxsize=1)
+def _soil_table() -> Dict[str, Tuple[float, float]]:
+    # soil_type -> (fc_vwc, sat_vwc), read once on first use
+    return {
+        row.soil_type: (float(row.fc_vwc), float(row.sat_vwc))
+        for row in pd.read_csv(
+            SOIL_PROPERTIES_CSV,
+            dtype={"soil_type": "str", "fc_vwc": "float64", "sat_vwc": "float64"},
+        ).itertuples(index=False)
+    }
+
+
+def soil_properties(soil_type: str) -> Tuple[float, float]:
+    """
+    Look up the field capacity and saturation presets for a soil type.
+
+    Parameters
+    ----------
+    soil_type : str
+        Soil texture name as listed in data/soil_water_properties.csv
+        (e.g. "clay_loam").
+
+    Returns
+    -------
+    fc_vwc, sat_vwc : float
+        Field capacity and saturation as fractional volumetric water content.
+    """
+    try:
+        return _soil_table()[soil_type]
+    except KeyError:
+        raise ValueError(f"Soil type '{soil_type}' not found") from None
+
+
+@lru_cache(maxsize=None)
+def _soil_coefficients(soil_type: str) -> Tuple[float, float]:
+    # (fc_vwc, 1 / (sat_vwc - fc_vwc)) so normalization is a subtract and a
+    # multiply per value; a bad preset only fails for its own soil type
+    fc_vwc, sat_vwc = soil_properties(soil_type)
+
+    if sat_vwc <= fc_vwc:
+        raise ValueError(
+            f"Soil type '{soil_type}' has sat_vwc <= fc_vwc ({sat_vwc} <= {fc_vwc})"
+        )
+
+    return fc_vwc, 1.0 / (sat_vwc - fc_vwc)
+
+
+def normalize_moisture(cleaned_readings: np.ndarray, soil_type: str) -> np.ndarray:
     """
     Convert raw soil moisture values into a normalized saturation measure.
 
@@ -11,7 +63,8 @@ def normalize_moisture(cleaned_readings: Dict[str, float], soil_type: str) -> Di
     -----------
     - cleaned_readings values are fractional volumetric water content (vwc),
       typically between 0 and 1.
-    - fc_vwc (field capacity) and sat_vwc (saturation) are defined in config.py.
+    - fc_vwc (field capacity) and sat_vwc (saturation) come from
+      soil_properties(soil_type).
 
     Definition:
     -----------
@@ -32,28 +85,16 @@ def normalize_moisture(cleaned_readings: Dict[str, float], soil_type: str) -> Di
 
     Parameters
     ----------
-    cleaned_readings : dict
-        Current timestep's cleaned soil moisture values (theta) with keys like:
-        "north_sensor", "east_sensor", "south_sensor", "west_sensor",
+    cleaned_readings : np.ndarray
+        Cleaned soil moisture values (theta), last axis ordered as
+        quality_control.CHANNELS: a single (4,) reading or an (N, 4) stack.
 
     Returns
     -------
-    dict
-        Normalized saturation values with the same keys. Values are unitless.
+    np.ndarray
+        Normalized saturation values with the same shape. Values are unitless.
     """
-    soil_water_properties = pd.read_csv(f"data/soil_water_properties.csv")
-    row = soil_water_properties.loc[soil_water_properties['soil_type'] == soil_type]
-
-    if row.empty:
-        raise ValueError(f"Soil type '{soil_type}' not found")
-
-    fc_vwc = float(row["fc_vwc"].values[0])
-    sat_vwc = float(row["sat_vwc"].values[0])
-
-    saturation: Dict[str, float] = {}
-
-    for key, vwc in cleaned_readings.items():
-        S = (vwc - fc_vwc) / (sat_vwc - fc_vwc)
-        saturation[key] = S
+    fc_vwc, inv_range = _soil_coefficients(soil_type)
 
-    return saturation
+    vwc = np.asarray(cleaned_readings, dtype=np.float64)
+    return (vwc - fc_vwc) * inv_range
@@ -1,11 +1,40 @@
-from typing import Dict, List, Optional
-import math
-from statistics import median
+from typing import Optional
 
+import numpy as np
 
-def _reading_passes_basic_qc(reading: Dict[str, float]) -> bool:
+# Fixed channel order of every (N, 4) sensor array in the pipeline
+CHANNELS = ("north_sensor", "south_sensor", "east_sensor", "west_sensor")
+
+
+def _stack_readings(batch_readings) -> np.ndarray:
     """
-    Basic QC for a single raw reading.
+    Return the batch as an (n_readings, 4) float array in CHANNELS order.
+
+    Arrays pass through as-is; a list of {"north_sensor": ...} dicts (the
+    shape of a raw Firebase batch) is copied into a preallocated array in
+    a single pass. Missing, None, or non-numeric values become NaN so the
+    reading fails QC like any other missing value.
+    """
+
+    if isinstance(batch_readings, np.ndarray):
+        return batch_readings.astype(np.float64, copy=False)
+
+    readings = np.empty((len(batch_readings), len(CHANNELS)), dtype=np.float64)
+
+    for i, reading in enumerate(batch_readings):
+        for k, key in enumerate(CHANNELS):
+            value = reading.get(key)
+            try:
+                readings[i, k] = np.nan if value is None else value
+            except (TypeError, ValueError):
+                readings[i, k] = np.nan
+
+    return readings
+
+
+def _basic_qc_mask(readings: np.ndarray) -> np.ndarray:
+    """
+    Basic QC for every raw reading of a batch at once.
 
     Conditions (v1):
     - All sensor values must be real numbers (no None, no NaN).
@@ -13,35 +42,24 @@ def _reading_passes_basic_qc(reading: Dict[str, float]) -> bool:
     - TODO: check timestamp
 
     If any sensor fails these checks, the entire reading is rejected.
+    Returns a boolean mask with one entry per reading (row).
     """
 
-    for _, value in reading.items():
-        # Reject missing values
-        if value is None:
-            return False
-
-        # Reject non-float-ish or NaN
-        try:
-            v = float(value)
-        except (TypeError, ValueError):
-            return False
-
-        if math.isnan(v):
-            return False
-
-        if not (0.0 <= v <= 1.0):
-            return False
-
-    return True
+    # NaN compares False against both bounds, so it is rejected here too
+    return ((readings >= 0.0) & (readings <= 1.0)).all(axis=1)
 
 
 def QC_and_smooth(
-    batch_readings: List[Dict[str, float]],
-    previous_valid_reading: Optional[Dict[str, float]] = None,
-) -> Dict[str, float]:
+    batch_readings,
+    previous_valid_reading: Optional[np.ndarray] = None,
+) -> np.ndarray:
     """
     Quality control for a batch of readings at a single 15-minute interval.
 
+    batch_readings is an (n_readings, 4) array with columns ordered as
+    CHANNELS, or a list of per-reading dicts keyed by CHANNELS. The
+    smoothed reading is returned as a length-4 array in CHANNELS order.
+
     Now actually uses the whole batch:
 
     1. Filter to readings that pass basic QC (no NaN, 0–1 range).
@@ -52,24 +70,19 @@ def QC_and_smooth(
          - Otherwise raise ValueError.
     """
 
-    if not batch_readings:
+    if len(batch_readings) == 0:
         if previous_valid_reading is not None:
             return previous_valid_reading
         raise ValueError("QC_and_smooth: no readings provided and no previous_valid_reading.")
 
+    readings = _stack_readings(batch_readings)
+
     # 1. Keep only readings that pass QC
-    valid_readings = [r for r in batch_readings if _reading_passes_basic_qc(r)]
+    valid_readings = readings[_basic_qc_mask(readings)]
 
     # 2. If we have at least one valid reading, smooth via per-sensor median
-    if valid_readings:
-        smoothed: Dict[str, float] = {}
-        sensor_keys = valid_readings[0].keys()
-
-        for key in sensor_keys:
-            values = [float(r[key]) for r in valid_readings]
-            smoothed[key] = float(median(values))
-
-        return smoothed
+    if len(valid_readings):
+        return np.median(valid_readings, axis=0)
 
     # 3. If all readings failed QC, fall back if possible
     if previous_valid_reading is not None:
@@ -0,0 +1,10 @@
+from src.risk_components.soil_saturation import compute_soil_saturation_component, make_soil_component
+from src.risk_components.storm_severity import compute_storm_severity_component
+from src.risk_components.site_sensitivity import compute_site_sensitivity_component
+
+__all__ = [
+    "compute_soil_saturation_component",
+    "make_soil_component",
+    "compute_storm_severity_component",
+    "compute_site_sensitivity_component",
+]
@@ -1,5 +1,12 @@
-import pandas as pd
+from numba import njit
 
+# DELTA_S_REF = 0.1 means: a 10% jump toward saturation in 1 hour.
+# Numba freezes module globals, so the reciprocal is a compile-time constant.
+DELTA_S_REF = 0.1
+_INV_DELTA_S_REF = 1.0 / DELTA_S_REF
+
+
+@njit(cache=True, fastmath={"contract"})
 def compute_site_sensitivity_component(
     soil_saturation_current: float,
     soil_saturation_1h_ago: float,
@@ -35,8 +42,6 @@ def compute_site_sensitivity_component(
 
     delta_S_1h = max(0.0, soil_saturation_current - soil_saturation_1h_ago)
 
-    # DELTA_S_REF = 0.1 means: a 10% jump toward saturation in 1 hour
-    DELTA_S_REF = 0.1
-    sensitivity_index = delta_S_1h / DELTA_S_REF
+    sensitivity_index = delta_S_1h * _INV_DELTA_S_REF
 
     return max(0.0, min(sensitivity_index, 1.0))
\ No newline at end of file
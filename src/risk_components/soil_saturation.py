@@ -1,3 +1,18 @@
+import numpy as np
+from numba import njit
+
+# Knots of the piecewise-linear S -> base risk curve described below.
+# np.interp holds the end values outside the table, which gives the dry
+# floor (0 for S <= 0.2) and the cap (100 for S >= 1.5) for free.
+#   S:    0.2 (dry threshold), 1.0 (nominal saturation), 1.5 (cap)
+#   risk: 0                    70 (leaves amplification headroom), 100
+DRY_THRESHOLD = 0.2
+
+_S_KNOTS = np.array([DRY_THRESHOLD, 1.0, 1.5])
+_BASE_RISK_KNOTS = np.array([0.0, 70.0, 100.0])
+
+
+@njit(cache=True, fastmath={"contract"})
 def compute_soil_saturation_component(
     soil_saturation_current: float,
 ) -> float:
@@ -29,22 +44,52 @@ def compute_soil_saturation_component(
         This is *before* storm severity or site sensitivity amplification.
     """
 
-    S = soil_saturation_current
-
-    # Very dry soil: no meaningful seepage risk.
-    if S <= 0.2:
-        return 0.0
-
-    # Moderate range: gradually increasing risk.
-    if 0.2 < S <= 1.0:
-        # Map S from [0.2, 1.0] -> base risk [0, 70]
-        # 70 is a scaling choice to leave headroom for amplification.
-        fraction = (S - 0.2) / (1.0 - 0.2)  # 0–1
-        return fraction * 70.0
-
-    # Very wet range: soil is above nominal saturation, risk rises quickly.
-    # Clamp S at 1.5 to avoid unbounded growth from this component alone.
-    S_capped = min(S, 1.5)
-    # Map S from [1.0, 1.5] -> additional [70, 100]
-    fraction = (S_capped - 1.0) / (1.5 - 1.0)  # 0–1
-    return 70.0 + fraction * 30.0
\ No newline at end of file
+    # Table lookup instead of an if-ladder: no data-dependent branches, and
+    # the same call works on a whole array of S values.
+    return np.interp(soil_saturation_current, _S_KNOTS, _BASE_RISK_KNOTS)
+
+
+def make_soil_component(
+    dry_threshold: float = DRY_THRESHOLD,
+    saturation_point: float = 1.0,
+    cap: float = 1.5,
+):
+    """
+    Build a compute_soil_saturation_component specialized to one preset.
+
+    The curve has the same shape as compute_soil_saturation_component
+    (0 below dry_threshold, linear to 70 at saturation_point, linear to 100
+    at cap) but with preset-specific thresholds in normalized S. The
+    thresholds are captured as constants of the returned @njit function, so
+    each preset gets its own compiled (and disk-cached) specialization.
+
+    compute_risk_score is not parameterized by preset: its dry-tick early
+    return assumes DRY_THRESHOLD. A component built with a different
+    dry_threshold must be combined with the other components directly,
+    not swapped in behind compute_risk_score.
+
+    Parameters
+    ----------
+    dry_threshold, saturation_point, cap : float
+        Strictly increasing S values of the three curve knots.
+
+    Returns
+    -------
+    soil_component : callable
+        Compiled function S -> base risk score in [0, 100].
+    """
+
+    if not (dry_threshold < saturation_point < cap):
+        raise ValueError(
+            "make_soil_component: thresholds must satisfy "
+            "dry_threshold < saturation_point < cap."
+        )
+
+    s_knots = np.array([dry_threshold, saturation_point, cap])
+    base_risk_knots = _BASE_RISK_KNOTS.copy()
+
+    @njit(cache=True, fastmath={"contract"})
+    def soil_component(soil_saturation_current: float) -> float:
+        return np.interp(soil_saturation_current, s_knots, base_risk_knots)
+
+    return soil_component
@@ -1,3 +1,14 @@
+from numba import njit
+
+# Forecast / IDF ratio at or below which a storm adds no risk
+MODERATE_RATIO_START = 0.3
+
+# Reciprocal widths of the two ramps below, folded to constants by Numba
+_INV_MODERATE_SPAN = 1.0 / (1.0 - MODERATE_RATIO_START)
+_INV_SEVERE_SPAN = 1.0 / (1.5 - 1.0)
+
+
+@njit(cache=True, fastmath={"contract"})
 def compute_storm_severity_component(
     forecast_24h_mm: float,
     IDF_24h_2yr_mm: float,
@@ -34,18 +45,26 @@ def compute_storm_severity_component(
         is capable of increasing risk, *relative* to the local climate.
         This factor will be combined with site sensitivity to adjust
         the base soil risk.
+
+    Raises
+    ------
+    ZeroDivisionError
+        If IDF_24h_2yr_mm is zero.
     """
+    # Explicit, because Numba's implicit division check is dropped when this
+    # is compiled into the compute_risk_score_batch ufunc
+    if IDF_24h_2yr_mm == 0.0:
+        raise ZeroDivisionError("IDF_24h_2yr_mm is zero")
+
     storm_severity_ratio = forecast_24h_mm / IDF_24h_2yr_mm
 
-    if storm_severity_ratio <= 0.3:
-        # Very small event relative to local climate → negligible extra risk.
-        return 0.0
+    # Written as clamped straight-line arithmetic (no branches) so batched
+    # callers can vectorize it.
+
+    # Map [0.3, 1.0] -> [0.0, 1.0]; very small events (<= 0.3) add nothing.
+    moderate = min(max((storm_severity_ratio - MODERATE_RATIO_START) * _INV_MODERATE_SPAN, 0.0), 1.0)
 
-    if 0.3 < storm_severity_ratio <= 1.0:
-        # Map [0.3, 1.0] -> [0.0, 1.0]
-        return (storm_severity_ratio - 0.3) / (1.0 - 0.3)
+    # Map [1.0, 1.5] -> extra [0.0, 0.5]; ratios above 1.5 are capped.
+    severe = min(max((storm_severity_ratio - 1.0) * _INV_SEVERE_SPAN, 0.0), 1.0) * 0.5
 
-    # storm_severity_ratio > 1.0
-    ratio_capped = min(storm_severity_ratio, 1.5)
-    # Map [1.0, 1.5] -> [1.0, 1.5]
-    return 1.0 + (ratio_capped - 1.0) / (1.5 - 1.0) * 0.5
\ No newline at end of file
+    return moderate + severe
\ No newline at end of file
@@ -1,10 +1,19 @@
-from src.risk_components.soil_saturation import compute_soil_saturation_component
-from src.risk_components.storm_severity import compute_storm_severity_component
+from src.risk_components.soil_saturation import DRY_THRESHOLD, compute_soil_saturation_component
+from src.risk_components.storm_severity import MODERATE_RATIO_START, compute_storm_severity_component
 from src.risk_components.site_sensitivity import compute_site_sensitivity_component
 
 from typing import Tuple
 
+import numpy as np
+from numba import float64, njit, vectorize
 
+# Lower edges of Moderate, High and Severe; see map_risk_category.
+# np.digitize(score, CATEGORY_BINS) is the index into CATEGORY_LABELS.
+CATEGORY_BINS = np.array([30.0, 60.0, 80.0], dtype=np.float64)
+CATEGORY_LABELS = np.array(["Low", "Moderate", "High", "Severe"], dtype=object)
+
+
+@njit(cache=True, fastmath={"contract"})
 def compute_risk_score(
     soil_saturation_current: float,
     soil_saturation_1h_ago: float,
@@ -33,6 +42,13 @@ def compute_risk_score(
 
     5. RiskDisplayed is then clamped to [0, 100] for user-facing simplicity.
 
+    Dry, calm ticks (the common case) return all zeros early: soil at or
+    below the soil component's DRY_THRESHOLD, a forecast at most
+    MODERATE_RATIO_START times a positive IDF depth, and no saturation rise
+    over the last hour make every component exactly 0. The shortcut only
+    applies to a positive IDF depth; an IDF depth of zero raises
+    ZeroDivisionError from the storm component.
+
     Returns
     -------
     risk_score_internal : float
@@ -47,6 +63,14 @@ def compute_risk_score(
         Site sensitivity factor from recent soil behavior.
     """
 
+    if (
+        soil_saturation_current <= DRY_THRESHOLD
+        and IDF_24h_2yr_mm > 0.0
+        and forecast_24h_mm <= MODERATE_RATIO_START * IDF_24h_2yr_mm
+        and soil_saturation_current <= soil_saturation_1h_ago
+    ):
+        return 0.0, 0.0, 0.0, 0.0, 0.0
+
     base_soil_risk = compute_soil_saturation_component(soil_saturation_current)
     storm_factor = compute_storm_severity_component(forecast_24h_mm, IDF_24h_2yr_mm)
     site_sensitivity_factor = compute_site_sensitivity_component(
@@ -61,6 +85,40 @@ def compute_risk_score(
     return risk_score_internal, risk_score_displayed, base_soil_risk, storm_factor, site_sensitivity_factor
 
 
+@vectorize(
+    [float64(float64, float64, float64, float64)],
+    target="parallel",
+    fastmath={"contract"},
+    cache=True,
+)
+def compute_risk_score_batch(
+    soil_saturation_current,
+    soil_saturation_1h_ago,
+    forecast_24h_mm,
+    IDF_24h_2yr_mm,
+):
+    """
+    Element-wise compute_risk_score over arrays of inputs (a NumPy ufunc).
+
+    Inputs broadcast like any ufunc, so e.g. one IDF depth can be shared by
+    many houses or forecast ensemble members. Elements are evaluated in
+    parallel across cores.
+
+    Returns
+    -------
+    risk_score_internal : ndarray
+        Same as the first value returned by compute_risk_score. Clamp with
+        np.clip(risk, 0.0, 100.0) for the displayed score.
+    """
+
+    return compute_risk_score(
+        soil_saturation_current,
+        soil_saturation_1h_ago,
+        forecast_24h_mm,
+        IDF_24h_2yr_mm,
+    )[0]
+
+
 def map_risk_category(risk_score_displayed: float) -> str:
     """
     Map the displayed risk score (0–100) into a user-facing category.
@@ -130,3 +188,16 @@ def map_risk_category(risk_score_displayed: float) -> str:
         return "High"
     else:
         return "Severe"
+
+
+def map_risk_category_batch(risk_scores_displayed) -> np.ndarray:
+    """
+    Vectorized map_risk_category for an array of displayed risk scores.
+
+    Uses the same half-open bands as map_risk_category (a score of exactly
+    30 is Moderate, 60 is High, 80 is Severe) and returns an object array
+    of labels from CATEGORY_LABELS.
+    """
+
+    scores = np.asarray(risk_scores_displayed, dtype=np.float64)
+    return CATEGORY_LABELS[np.digitize(scores, CATEGORY_BINS)]
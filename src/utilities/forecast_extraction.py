@@ -1,17 +1,54 @@
+import time
+import warnings
+from typing import Dict, Tuple
+
+import numpy as np
 import openmeteo_requests
-import pandas as pd
+
+# GEM updates every few hours, so a fetched total is reused for one 15-min
+# tick per grid cell: (round(lat, 3), round(lon, 3)) -> (fetched_at, total_24h)
+_PRECIP_TTL_S = 15 * 60
+_PRECIP_CACHE: Dict[Tuple[float, float], Tuple[float, float]] = {}
+
+# One client for the whole module so its connection pool (and TLS session)
+# is reused across calls. Uses the built-in session (avoids ALL type-checker issues)
+_OM_CLIENT = openmeteo_requests.Client()
 
 
 def get_24h_precip(lat: float, lon: float):
     """
     Fetch the next 24 hours of precipitation from the Open-Meteo GEM model.
 
+    Results are cached per ~100 m grid cell for 15 minutes. If the request
+    fails, the last known total for the cell is returned (with a warning)
+    rather than stopping the pipeline.
+
     Returns:
         total_24h (float): total precip sum in mm
     """
+    key = (round(lat, 3), round(lon, 3))
+    cached = _PRECIP_CACHE.get(key)
+    now = time.monotonic()
+
+    if cached is not None and now - cached[0] < _PRECIP_TTL_S:
+        return cached[1]
+
+    try:
+        total_24h = _fetch_24h_precip(lat, lon)
+    except (openmeteo_requests.OpenMeteoRequestsError, RuntimeError) as exc:
+        if cached is None:
+            raise
+        warnings.warn(f"Using last known 24h precipitation for {key}: {exc}")
+        return cached[1]
 
-    # Use built-in session (avoids ALL type-checker issues)
-    openmeteo = openmeteo_requests.Client()
+    _PRECIP_CACHE[key] = (now, total_24h)
+    return total_24h
+
+
+def _fetch_24h_precip(lat: float, lon: float) -> float:
+    """
+    Request the hourly GEM forecast and sum its first 24 hours (mm).
+    """
 
     url = "https://api.open-meteo.com/v1/forecast"
 
@@ -24,7 +61,7 @@ def get_24h_precip(lat: float, lon: float):
         "timezone": "America/Toronto"
     }
 
-    responses = openmeteo.weather_api(url, params=params)
+    responses = _OM_CLIENT.weather_api(url, params=params)
     response = responses[0]
 
     hourly = response.Hourly()
@@ -39,24 +76,12 @@ def get_24h_precip(lat: float, lon: float):
     # Variable index matches order in "hourly" param
     precip = var0.ValuesAsNumpy()
 
-    # Construct hourly timestamps using metadata
-    times = pd.date_range(
-        start=pd.to_datetime(hourly.Time(), unit="s"),
-        end=pd.to_datetime(hourly.TimeEnd(), unit="s"),
-        freq=pd.Timedelta(seconds=hourly.Interval()),
-        inclusive="left"
-    )
-
-    df = pd.DataFrame({
-        "timestamp": times,
-        "precip_mm": precip
-    })
-
-    # Extract EXACT next 24 hours from the first forecast hour
-    t0 = df["timestamp"].iloc[0]
-    t24 = t0 + pd.Timedelta(hours=24)
+    # Values sit on a regular grid starting at the first forecast hour, so
+    # the EXACT next 24 hours are simply the first 24h worth of steps
+    steps_24h = int(round(24 * 3600 / hourly.Interval()))
 
-    df_24h = df[(df["timestamp"] >= t0) & (df["timestamp"] < t24)]
-    total_24h = float(df_24h["precip_mm"].sum())
+    # nansum so missing hours count as zero, as the old DataFrame sum did
+    total_24h = float(np.nansum(precip[:steps_24h], dtype=np.float64))
 
-    return round(total_24h, 2)
+    # Unrounded: rounding for display happens when results are written
+    return total_24h
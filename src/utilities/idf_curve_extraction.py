@@ -1,8 +1,26 @@
+import pickle
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Tuple
+
 import requests
+from requests.adapters import HTTPAdapter
 import xml.etree.ElementTree as ET
 
 MTO_XML_BASE = "https://idfcurves.mto.gov.on.ca/data_xml/"
 
+# Indexed IDF tables persisted between runs; climatological data, so a
+# 30-day refresh is plenty
+IDF_CACHE_DIR = Path.home() / ".cache" / "floodmon" / "idf"
+_IDF_CACHE_TTL_S = 30 * 86400
+
+# Shared session so back-to-back XML downloads reuse pooled connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+
+@lru_cache(maxsize=1024)
 def to_grid_coordinate(coord: float) -> float:
     """
     Recreates the MTO JavaScript toGridCoordinate() rounding to 30-second grid.
@@ -29,6 +47,71 @@ def to_grid_coordinate(coord: float) -> float:
     return float(f"{coord:.6f}")
 
 
+def _load_cached_idf_table(cache_path: Path):
+    """
+    Return the pickled IDF table at cache_path, or None if it can't be read.
+    """
+    try:
+        with cache_path.open("rb") as fh:
+            return pickle.load(fh)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+@lru_cache(maxsize=256)
+def _fetch_idf_table(xml_url: str) -> Dict[str, Dict[str, Tuple[float, float]]]:
+    """
+    Download one MTO IDF XML file (one per snapped latitude) and index it as
+    {coord_id: {period_id: (a, b)}}, so lookups don't rescan the document.
+
+    The table is also pickled under IDF_CACHE_DIR and reused by later runs
+    for up to 30 days; an expired copy is still used if MTO is unreachable.
+    """
+    cache_path = IDF_CACHE_DIR / (xml_url.rsplit("/", 1)[-1].removesuffix(".xml") + ".pkl")
+
+    try:
+        is_fresh = time.time() - cache_path.stat().st_mtime < _IDF_CACHE_TTL_S
+    except OSError:
+        is_fresh = False
+
+    if is_fresh:
+        table = _load_cached_idf_table(cache_path)
+        if table is not None:
+            return table
+
+    try:
+        resp = _SESSION.get(xml_url, timeout=20)
+        resp.raise_for_status()
+    except requests.RequestException:
+        table = _load_cached_idf_table(cache_path)
+        if table is not None:
+            return table
+        raise
+
+    root = ET.fromstring(resp.text)
+
+    table = {
+        coord_elem.attrib["id"]: {
+            period_elem.attrib["id"]: (
+                float(period_elem.attrib["a"]),
+                float(period_elem.attrib["b"]),
+            )
+            for period_elem in coord_elem.iter("period")
+        }
+        for coord_elem in root.iter("coord")
+    }
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with cache_path.open("wb") as fh:
+            pickle.dump(table, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # Disk cache is best-effort; the in-process cache still applies
+
+    return table
+
+
+@lru_cache(maxsize=4096)
 def get_idf_depth(
     lat: float,
     lon: float,
@@ -38,6 +121,9 @@ def get_idf_depth(
     """
     Get rainfall depth (mm) from MTO IDF data for a given lat/lon,
     storm duration (hours), and return period (years).
+
+    IDF curves are static reference data, so results (and the indexed XML
+    per latitude) are cached for the life of the process.
     """
     # Snap to the same grid MTO uses
     grid_lat = to_grid_coordinate(lat)
@@ -46,26 +132,25 @@ def get_idf_depth(
     # XML filename is based only on the snapped latitude
     xml_url = f"{MTO_XML_BASE}{grid_lat:.6f}.xml"
 
-    resp = requests.get(xml_url, timeout=20)
-    resp.raise_for_status()
-    root = ET.fromstring(resp.text)
+    idf_table = _fetch_idf_table(xml_url)
 
     # coord id uses snapped lat and lon
     coord_id = f"{grid_lat:.6f},{grid_lon:.6f}"
-    coord_elem = root.find(f".//coord[@id='{coord_id}']")
-    if coord_elem is None:
+    periods = idf_table.get(coord_id)
+    if periods is None:
         raise ValueError(f"No coord found for {coord_id} in {xml_url}")
 
-    period_elem = coord_elem.find(f"./period[@id='{return_period}']")
-    if period_elem is None:
+    coefficients = periods.get(str(return_period))
+    if coefficients is None:
         raise ValueError(f"No {return_period}-yr period for coord {coord_id}")
 
-    a = float(period_elem.attrib["a"])
-    b = float(period_elem.attrib["b"])
+    a, b = coefficients
 
     # MTO intensity formula: I = A * t^B (mm/h), t in hours
     # Depth = I * t = A * t^(B+1)
     t = float(duration_hours)
+    # Unrounded: the depth only feeds the forecast / IDF ratio, and display
+    # rounding happens when results are written
     depth_mm = a * (t ** (b + 1.0))
 
-    return round(depth_mm, 2)
+    return depth_mm